@@ -0,0 +1,725 @@
+#!/usr/bin/env python3
+"""Remote control for Pinepods Firewood players on the local network.
+
+Discovers firewood players advertising themselves over mDNS
+(``_pinepods-remote._tcp``) and drives them over their HTTP control API:
+beam an episode URL to a player, pause/resume, seek, change volume, or
+sit in monitor mode and watch playback progress.
+
+Requires: requests, zeroconf  (pip install requests zeroconf)
+"""
+
+import argparse
+import asyncio
+import atexit
+import concurrent.futures
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from types import MappingProxyType
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# zeroconf is imported lazily inside the discovery paths: it pulls in
+# ifaddr and opens sockets on first touch, a startup cost the common
+# "-u HOST -i" path never needs to pay.
+
+# orjson decodes/encodes the small control-API payloads several times
+# faster than stdlib json; fall back silently when it isn't installed.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# aiohttp is only used to fan out --discover probes; without it the
+# listing falls back to probing players one at a time.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+SERVICE_TYPE = "_pinepods-remote._tcp.local."
+DEFAULT_PORT = 8042
+
+# Shared Zeroconf instance: multicast sockets and the mDNS cache are
+# expensive to set up, so repeated discoveries reuse one warm instance.
+_ZC = None
+_ZC_LOCK = threading.Lock()
+
+
+def get_zeroconf():
+    global _ZC
+    with _ZC_LOCK:
+        if _ZC is None:
+            from zeroconf import Zeroconf
+
+            _ZC = Zeroconf()
+            atexit.register(_ZC.close)
+        return _ZC
+
+
+class FirewoodPlayerListener:
+    """Collects firewood players as Zeroconf announces them.
+
+    Duck-types the zeroconf ServiceListener protocol so the module
+    doesn't need zeroconf imported just to define the class.
+    """
+
+    def __init__(self):
+        # Copy-on-write: mutations rebuild _mutable and rebind players
+        # under the lock, so readers get a stable read-only snapshot
+        # without taking the lock or copying.
+        self._mutable = {}
+        self.players = MappingProxyType(self._mutable)
+        self.lock = threading.Lock()
+        self.discovered = threading.Event()
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+    def add_service(self, zeroconf, type, name):
+        # get_service_info does network I/O; resolve off the Zeroconf
+        # callback thread so simultaneous announcements don't serialize.
+        self.pool.submit(self._resolve, zeroconf, type, name)
+
+    @staticmethod
+    def _parse_txt(data):
+        """Decode a raw TXT rdata blob (length-prefixed key=value pairs)."""
+        props = {}
+        i = 0
+        while i < len(data):
+            length = data[i]
+            chunk = data[i + 1:i + 1 + length]
+            i += 1 + length
+            if b"=" in chunk:
+                key, _, value = chunk.partition(b"=")
+                props[key.decode()] = value.decode()
+        return props
+
+    @staticmethod
+    def _from_cache(zeroconf, name):
+        """Synthesize (host, port, properties) from already-cached records.
+
+        The PTR answer that triggered add_service usually carried the
+        SRV/TXT/A records along with it, so querying again is wasted
+        round trips. Returns None when any piece is missing.
+        """
+        try:
+            from zeroconf import DNSAddress, DNSService, DNSText
+
+            srv = txt = None
+            for record in zeroconf.cache.entries_with_name(name):
+                if isinstance(record, DNSService):
+                    srv = record
+                elif isinstance(record, DNSText):
+                    txt = record
+            if srv is None or txt is None:
+                return None
+            addr = next(
+                (
+                    record
+                    for record in zeroconf.cache.entries_with_name(srv.server)
+                    if isinstance(record, DNSAddress) and len(record.address) == 4
+                ),
+                None,
+            )
+            if addr is None:
+                return None
+            host = socket.inet_ntoa(addr.address)
+            return host, srv.port, FirewoodPlayerListener._parse_txt(txt.text)
+        except Exception:
+            # cache internals vary across zeroconf versions — any
+            # surprise just means "go ask the network"
+            return None
+
+    def _resolve(self, zeroconf, type, name):
+        # Resolve and format entirely outside the lock; only the dict
+        # mutation needs it, and printing under it would stall
+        # get_players/remove_service behind terminal I/O.
+        cached = self._from_cache(zeroconf, name)
+        if cached is not None:
+            host, port, props = cached
+        else:
+            info = zeroconf.get_service_info(type, name, timeout=500)
+            if info is None:
+                return
+            addrs = info.parsed_addresses()
+            if not addrs:
+                return
+            host = addrs[0]
+            port = info.port
+            props = {k.decode(): v.decode() for k, v in (info.properties or {}).items()}
+        entry = {
+            "name": props.get("name", name.split(".")[0]),
+            "host": host,
+            "port": port,
+            "properties": props,
+        }
+        with self.lock:
+            new = dict(self._mutable)
+            new[name] = entry
+            self._mutable = new
+            self.players = MappingProxyType(new)
+        print(f"🔥 Found player: {entry['name']}")
+        print(f"   http://{host}:{port}")
+        self.discovered.set()
+
+    def remove_service(self, zeroconf, type, name):
+        with self.lock:
+            new = dict(self._mutable)
+            gone = new.pop(name, None)
+            self._mutable = new
+            self.players = MappingProxyType(new)
+        if gone:
+            print(f"👋 Player left: {gone['name']}")
+
+    def update_service(self, zeroconf, type, name):
+        pass
+
+    def get_players(self):
+        # Lock-free: the proxy is rebound atomically on mutation and the
+        # dict behind any snapshot is never modified again.
+        return self.players
+
+
+def discover_players(timeout=5.0, min_wait=0.5, target=1, list_all=False):
+    """Browse the LAN for firewood players.
+
+    Returns as soon as `target` players have answered (after at least
+    `min_wait` seconds, so a burst of announcements isn't cut short)
+    instead of always sleeping out the full `timeout`. Pass
+    `list_all=True` to wait the whole window, e.g. for --discover.
+    """
+    try:
+        from zeroconf import ServiceBrowser
+    except ImportError:
+        print("❌ Discovery needs zeroconf — pip install zeroconf (or pass -u HOST)")
+        return {}
+    zeroconf = get_zeroconf()
+    listener = FirewoodPlayerListener()
+    browser = ServiceBrowser(zeroconf, SERVICE_TYPE, listener)
+    print(f"🔍 Searching for firewood players ({timeout:.0f}s)...")
+    try:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
+            if list_all:
+                # exhaustive listing: sleep out the window while the
+                # listener keeps collecting in the background
+                time.sleep(0.1)
+                continue
+            listener.discovered.wait(0.1)
+            listener.discovered.clear()
+            # Check the player count directly rather than the one-shot
+            # event, so an answer that lands before min_wait still
+            # trips the early exit once min_wait has passed.
+            if (
+                len(listener.get_players()) >= target
+                and time.monotonic() - start >= min_wait
+            ):
+                break
+    finally:
+        # Cancel just the browser — the shared Zeroconf instance stays
+        # warm for the next discovery and is closed atexit.
+        browser.cancel()
+        listener.pool.shutdown(wait=False, cancel_futures=True)
+    return listener.get_players()
+
+
+async def _probe(session, url):
+    async with session.get(url + "/", timeout=aiohttp.ClientTimeout(total=2)) as r:
+        return await r.json()
+
+
+async def _probe_all(urls):
+    """Probe every discovered player concurrently; one RTT window total."""
+    connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *(_probe(session, url) for url in urls), return_exceptions=True
+        )
+
+
+class FirewoodRemoteControl:
+    """HTTP client for a single firewood player's control API."""
+
+    def __init__(self, host, port=DEFAULT_PORT):
+        self.base_url = f"http://{host}:{port}"
+        self.session = requests.Session()
+        # Tune the pool for the 2s monitor/status polling cadence: keep
+        # connections warm so we don't pay a TCP handshake per poll, and
+        # retry briefly on transient gateway errors.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Connection": "keep-alive",
+                # tiny LAN responses — gzip costs more than it saves
+                "Accept-Encoding": "identity",
+            }
+        )
+        # (connect, read) — keep a hung player from stalling the whole UI
+        self.timeout = (1.0, 3.0)
+        # conditional-GET state for /status (see get_status)
+        self._status_etag = None
+        self._status_cache = None
+        # None until we learn whether the player has /batch (see batch)
+        self._has_batch = None
+
+    def batch(self, ops):
+        """POST a list of ops to /batch in one round trip.
+
+        Returns the parallel list of results, or None when the player
+        doesn't support /batch (remembered after the first 404) so the
+        caller can fall back to individual endpoints.
+        """
+        if self._has_batch is False:
+            return None
+        try:
+            response = self.session.post(
+                f"{self.base_url}/batch", data=_dumps({"ops": ops}), timeout=self.timeout
+            )
+            if response.status_code == 404:
+                self._has_batch = False
+                return None
+            response.raise_for_status()
+            self._has_batch = True
+            return _loads(response.content).get("results")
+        except Exception as e:
+            print(f"❌ Batch call failed: {e}")
+            return None
+
+    def _request(self, method, path, json_body=None, error="Request failed"):
+        """Single choke point for the control API.
+
+        Timeouts, body encoding, and error reporting live here so they
+        only ever need changing in one place.
+        """
+        try:
+            response = self.session.request(
+                method,
+                self.base_url + path,
+                data=_dumps(json_body) if json_body is not None else None,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except Exception as e:
+            print(f"❌ {error}: {e}")
+            return None
+
+    def get_player_info(self):
+        return self._request("GET", "/", error="Could not reach player")
+
+    def get_status(self):
+        # Conditional GET: when the player sends an ETag, unchanged polls
+        # come back as an empty 304 and we reuse the cached JSON. Players
+        # that don't send one just keep answering 200 as before.
+        try:
+            headers = {}
+            if self._status_etag:
+                headers["If-None-Match"] = self._status_etag
+            response = self.session.get(
+                f"{self.base_url}/status", headers=headers, timeout=self.timeout
+            )
+            if response.status_code == 304:
+                return self._status_cache
+            response.raise_for_status()
+            self._status_etag = response.headers.get("ETag")
+            self._status_cache = _loads(response.content)
+            return self._status_cache
+        except Exception as e:
+            print(f"❌ Could not fetch status: {e}")
+            return None
+
+    def play_episode(self, url, title=None):
+        payload = {"url": url}
+        if title:
+            payload["title"] = title
+        return self._request("POST", "/play", payload, error="Could not beam episode")
+
+    def pause(self):
+        return self._request("POST", "/pause", error="Could not pause")
+
+    def resume(self):
+        return self._request("POST", "/resume", error="Could not resume")
+
+    def stop(self):
+        return self._request("POST", "/stop", error="Could not stop")
+
+    def skip(self, seconds):
+        return self._request("POST", "/skip", {"seconds": seconds}, error="Could not skip")
+
+    def seek(self, position):
+        return self._request("POST", "/seek", {"position": position}, error="Could not seek")
+
+    def stream_status(self):
+        """Yield status events pushed by the player over SSE.
+
+        Consumes GET /status/stream as text/event-stream. Yields nothing
+        when the player doesn't offer the endpoint (404/406) so the
+        caller can fall back to polling.
+        """
+        response = self.session.get(
+            f"{self.base_url}/status/stream",
+            stream=True,
+            timeout=(3, None),
+            headers={"Accept": "text/event-stream"},
+        )
+        if response.status_code in (404, 406):
+            response.close()
+            return
+        response.raise_for_status()
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                if line and line.startswith("data: "):
+                    yield _loads(line[len("data: "):])
+        finally:
+            response.close()
+
+    def set_volume(self, volume):
+        return self._request("POST", "/volume", {"volume": volume}, error="Could not set volume")
+
+
+def format_duration(seconds):
+    """Render seconds as MM:SS, or HH:MM:SS past the hour mark."""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+_last_status_sig = None
+# lines print_status emits, for the in-place cursor-up escape
+_STATUS_LINES = 3
+_status_primed = False
+
+
+def print_status(status, in_place=False):
+    global _last_status_sig, _status_primed
+    if not status:
+        return
+    # Skip reprints only for monitor ticks; an explicit status command
+    # should always answer, even when nothing changed.
+    title = status.get("title") or "(nothing loaded)"
+    position = int(status.get("position", 0))
+    duration = int(status.get("duration", 0))
+    volume = status.get("volume", 0)
+    sig = (status.get("is_playing"), position, duration, volume, title)
+    if in_place and sig == _last_status_sig:
+        return
+    _last_status_sig = sig
+    # Monitor mode redraws over the previous block instead of scrolling;
+    # piped output keeps the append-only form.
+    if in_place and _status_primed and sys.stdout.isatty():
+        sys.stdout.write(f"\033[{_STATUS_LINES}F\033[0J")
+    state = "▶️  Playing" if status.get("is_playing") else "⏸️  Paused"
+    print(f"{state}  {title}")
+    print(f"   ⏱  {format_duration(position)} / {format_duration(duration)}")
+    print(f"   🔊 {volume}%")
+    _status_primed = in_place
+
+
+DETAILED_HELP = """\
+Interactive commands:
+  s, status        show current playback status
+  p, pause         toggle pause/resume
+  stop             stop playback
+  beam URL [TITLE] beam an episode URL to the player
+  +N / -N          skip forward / back N seconds (e.g. +30, -15)
+  seek N           jump to N seconds from the start
+  vol N            set volume to N percent
+  info             show player name/version
+  monitor          live status updates every 2s (Ctrl+C to leave)
+  h, help          this text
+  q, quit          exit
+
+Player HTTP API:
+  GET  /            player info (name, version)
+  GET  /status      playback status JSON (ETag/If-None-Match supported)
+  GET  /status/stream  text/event-stream of status JSON pushes (optional)
+  POST /play        {"url": ..., "title": ...}
+  POST /pause       pause playback
+  POST /resume      resume playback
+  POST /stop        stop playback
+  POST /skip        {"seconds": N}  (negative to go back)
+  POST /seek        {"position": N}
+  POST /volume      {"volume": 0-100}
+  POST /batch       {"ops": [{"op": ...}, ...]} -> {"results": [...]} (optional)
+"""
+
+
+COMMANDS = ("status", "pause", "stop", "beam ", "seek ", "vol ", "info", "monitor", "help", "quit")
+HISTORY_FILE = os.path.expanduser("~/.firewood_history")
+
+
+def _setup_readline():
+    """Enable line editing, tab completion, and persistent history.
+
+    Best effort — readline is absent on some platforms and the prompt
+    works fine without it, just without the niceties.
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+
+    def complete(text, state):
+        matches = [c for c in COMMANDS if c.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.parse_and_bind("tab: complete")
+    readline.set_completer(complete)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+    def save_history():
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+
+    atexit.register(save_history)
+
+
+def interactive_control(controller):
+    """Prompt loop driving a single player."""
+    _setup_readline()
+    done = False
+
+    def handle_quit(command):
+        nonlocal done
+        done = True
+
+    def handle_help(command):
+        print(DETAILED_HELP)
+
+    def handle_status(command):
+        print_status(controller.get_status())
+
+    def handle_toggle(command):
+        # One round trip for status + toggle where the player supports
+        # /batch; two calls otherwise.
+        results = controller.batch([{"op": "status"}, {"op": "pause_or_resume"}])
+        if results is not None and len(results) >= 2:
+            was_playing = bool(results[0] and results[0].get("is_playing"))
+            print("⏸️  Paused" if was_playing else "▶️  Resumed")
+        else:
+            status = controller.get_status()
+            if status and status.get("is_playing"):
+                controller.pause()
+                print("⏸️  Paused")
+            else:
+                controller.resume()
+                print("▶️  Resumed")
+
+    def handle_stop(command):
+        controller.stop()
+        print("⏹  Stopped")
+
+    def handle_info(command):
+        info = controller.get_player_info()
+        if info:
+            print(f"🔥 {info.get('name', '?')} (firewood {info.get('version', '?')})")
+
+    def handle_monitor(command):
+        global _last_status_sig, _status_primed
+        # Fresh monitor session: forget the previous block so the first
+        # tick prints below the banner instead of cursoring up over it,
+        # and always renders even if the status hasn't changed since a
+        # prior monitor/status command.
+        _last_status_sig = None
+        _status_primed = False
+        print("📡 Monitoring — Ctrl+C to leave")
+        try:
+            # Prefer server push; events arrive as they happen and the
+            # wire stays idle otherwise.
+            pushed = False
+            try:
+                for event in controller.stream_status():
+                    pushed = True
+                    print_status(event, in_place=True)
+            except requests.RequestException:
+                pushed = False
+            if not pushed:
+                while True:
+                    print_status(controller.get_status(), in_place=True)
+                    time.sleep(2)
+        except KeyboardInterrupt:
+            print()
+        finally:
+            _status_primed = False
+
+    def handle_beam(command):
+        parts = command.split(maxsplit=2)
+        if len(parts) < 2:
+            print("❓ Use: beam URL [TITLE]")
+            return
+        url = parts[1]
+        title = parts[2] if len(parts) > 2 else None
+        if controller.play_episode(url, title):
+            print(f"🔥 Beamed {title or url}")
+
+    def handle_skip(command):
+        try:
+            seconds = int(command)
+        except ValueError:
+            print("❓ Use +N or -N seconds, e.g. +30")
+            return
+        controller.skip(seconds)
+
+    def handle_seek(command):
+        try:
+            position = int(command.split()[1])
+        except (IndexError, ValueError):
+            print("❓ Use: seek SECONDS")
+            return
+        controller.seek(position)
+
+    def handle_volume(command):
+        try:
+            volume = int(command.split()[1])
+        except (IndexError, ValueError):
+            print("❓ Use: vol 0-100")
+            return
+        controller.set_volume(volume)
+
+    # Exact-word commands dispatch O(1) off the first token; the
+    # prefix family (+N/-N) goes through a small predicate list.
+    handlers = {
+        "q": handle_quit,
+        "quit": handle_quit,
+        "exit": handle_quit,
+        "h": handle_help,
+        "help": handle_help,
+        "s": handle_status,
+        "status": handle_status,
+        "p": handle_toggle,
+        "pause": handle_toggle,
+        "stop": handle_stop,
+        "info": handle_info,
+        "monitor": handle_monitor,
+        "beam": handle_beam,
+        "seek": handle_seek,
+        "vol": handle_volume,
+    }
+    prefix_handlers = (
+        (lambda c: c.startswith(("+", "-")), handle_skip),
+    )
+
+    print("🔥 Connected — type 'help' for commands")
+    while not done:
+        try:
+            command = input("🎵 > ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+
+        if not command:
+            continue
+        handler = handlers.get(command) or handlers.get(command.split()[0])
+        if handler is None:
+            for predicate, fallback in prefix_handlers:
+                if predicate(command):
+                    handler = fallback
+                    break
+        if handler is None:
+            print("❓ Unknown command — 'help' lists everything")
+            continue
+        handler(command)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Remote control for Pinepods Firewood players"
+    )
+    parser.add_argument("-u", "--url", help="player host (skips discovery)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="player control port")
+    parser.add_argument("-d", "--discover", action="store_true", help="list players on the LAN")
+    parser.add_argument("--timeout", type=float, default=5.0, help="discovery timeout in seconds")
+    parser.add_argument("-i", "--interactive", action="store_true", help="interactive control prompt")
+    parser.add_argument("--detailed-help", action="store_true", help="show commands and API table")
+    parser.add_argument("command", nargs="*", help="one-shot command (status, pause, beam URL, ...)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.detailed_help:
+        print(DETAILED_HELP)
+        return
+
+    if args.discover:
+        players = discover_players(args.timeout, list_all=True)
+        if not players:
+            print("😞 No firewood players found")
+            return
+        print(f"\n🔥 {len(players)} player(s) on the network:")
+        infos = list(players.values())
+        urls = [f"http://{p['host']}:{p['port']}" for p in infos]
+        if aiohttp is not None:
+            details = asyncio.run(_probe_all(urls))
+        else:
+            details = [
+                FirewoodRemoteControl(p["host"], p["port"]).get_player_info()
+                for p in infos
+            ]
+        for i, (info, detail) in enumerate(zip(infos, details), 1):
+            version = detail.get("version", "?") if isinstance(detail, dict) else "?"
+            print(f"  {i}. {info['name']} — http://{info['host']}:{info['port']} (firewood {version})")
+        return
+
+    if args.url:
+        controller = FirewoodRemoteControl(args.url, args.port)
+    else:
+        players = discover_players(args.timeout)
+        if not players:
+            print("😞 No firewood players found — pass -u HOST to connect directly")
+            sys.exit(1)
+        first = next(iter(players.values()))
+        print(f"🔥 Using {first['name']} at {first['host']}:{first['port']}")
+        controller = FirewoodRemoteControl(first["host"], first["port"])
+
+    if args.command:
+        command = args.command
+        if command[0] == "status":
+            print_status(controller.get_status())
+        elif command[0] == "pause":
+            controller.pause()
+        elif command[0] == "resume":
+            controller.resume()
+        elif command[0] == "stop":
+            controller.stop()
+        elif command[0] == "beam" and len(command) > 1:
+            controller.play_episode(command[1], command[2] if len(command) > 2 else None)
+        elif command[0] == "vol" and len(command) > 1:
+            controller.set_volume(int(command[1]))
+        else:
+            print(f"❓ Unknown command: {' '.join(command)}")
+            sys.exit(1)
+        return
+
+    interactive_control(controller)
+
+
+if __name__ == "__main__":
+    main()